@@ -3,21 +3,17 @@
 from __future__ import annotations
 
 import logging
-from datetime import timedelta
 
-import async_timeout
 import voluptuous as vol
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant, ServiceCall
-from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers import device_registry as dr, config_validation as cv
-from homeassistant.helpers.entity_platform import async_get_platforms
-from homeassistant.helpers.service import verify_domain_control
 
 from .const import (
+    CONF_EVSE_ID,
+    DEVICE_INDEX,
     DOMAIN,
-    SCAN_INTERVAL,
     SERVICE_START_CHARGING,
     SERVICE_STOP_CHARGING,
 )
@@ -30,15 +26,63 @@ PLATFORMS: list[Platform] = [
 
 _LOGGER = logging.getLogger(__name__)
 
-# Schema for service data, including device_id for direct service calls
+# Shared validator for the charging current limit
+MAX_CURRENT_VALIDATOR = vol.All(vol.Coerce(int), vol.Range(min=6, max=32))
+
+# Schema for service data, including device_id for direct service calls.
+# Unknown keys are rejected so a misspelled max_current fails the call
+# instead of starting at the default current; device_id is the only target
+# key these services accept.
 SERVICE_DATA_SCHEMA = vol.Schema(
     {
         vol.Optional("device_id"): cv.string,
-        vol.Optional("max_current"): vol.All(vol.Coerce(int), vol.Range(min=6, max=32)),
+        vol.Optional("max_current"): MAX_CURRENT_VALIDATOR,
     }
 )
 
 
+def _resolve_device_coordinator(
+    hass: HomeAssistant, call: ServiceCall
+) -> tuple[EVChargerDataUpdateCoordinator, str]:
+    """Return the coordinator and EVSE ID for the device targeted by a service call."""
+    # Get device_id from call data
+    device_id = call.data.get("device_id")
+    if not device_id:
+        _LOGGER.error("No device_id provided in service call")
+        raise ValueError("No device_id provided in service call data")
+
+    # Resolve the coordinator and EVSE ID from the index built at setup
+    device_index = hass.data[DOMAIN].setdefault(DEVICE_INDEX, {})
+    if (resolved := device_index.get(device_id)) is not None:
+        return resolved
+
+    # Not indexed yet (e.g. the device registered after setup), scan once and
+    # remember the result
+    device = dr.async_get(hass).async_get(device_id)
+    if not device:
+        _LOGGER.error("Device %s not found", device_id)
+        raise ValueError(f"Device {device_id} not found")
+
+    evse_id = next(
+        (identifier for domain, identifier in device.identifiers if domain == DOMAIN),
+        None,
+    )
+    coordinator = next(
+        (
+            hass.data[DOMAIN][entry_id]
+            for entry_id in device.config_entries
+            if entry_id in hass.data[DOMAIN]
+        ),
+        None,
+    )
+    if evse_id is None or coordinator is None:
+        _LOGGER.error("Device %s is not an AMPECO EV Charger", device_id)
+        raise ValueError(f"Device {device_id} is not an AMPECO EV Charger")
+
+    device_index[device_id] = (coordinator, evse_id)
+    return coordinator, evse_id
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up EV Charger from a config entry."""
     coordinator = EVChargerDataUpdateCoordinator(
@@ -46,7 +90,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         config_entry=entry,
     )
 
-    await coordinator.async_config_entry_first_refresh()
+    try:
+        await coordinator.async_config_entry_first_refresh()
+    except Exception:
+        await coordinator.async_shutdown()
+        raise
 
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
 
@@ -54,86 +102,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     async def handle_start_charging(call: ServiceCall) -> None:
         """Handle the start charging service call."""
         _LOGGER.debug("Start charging service called with: %s", call.data)
-
-        # Get device_id from call data
-        device_id = call.data.get("device_id")
-        if not device_id:
-            _LOGGER.error("No device_id provided in service call")
-            raise ValueError("No device_id provided in service call data")
-
-        device_registry = dr.async_get(hass)
-        device = device_registry.async_get(device_id)
-
-        if not device:
-            _LOGGER.error("Device %s not found", device_id)
-            raise ValueError(f"Device {device_id} not found")
-
-        # Add detailed debug logging
-        _LOGGER.debug("Found device for start_charging: %s", device)
-        _LOGGER.debug(
-            "Device config entries for start_charging: %s", device.config_entries
-        )
-        _LOGGER.debug("Device identifiers for start_charging: %s", device.identifiers)
-        _LOGGER.debug("DOMAIN: %s", DOMAIN)
-
-        # Verify the device belongs to our integration by checking identifiers
-        # A device belongs to our integration if it has an identifier with our domain
-        device_belongs_to_integration = False
-        for domain, identifier in device.identifiers:
-            _LOGGER.debug("Checking identifier domain for start_charging: %s", domain)
-            if domain == DOMAIN:
-                device_belongs_to_integration = True
-                _LOGGER.debug(
-                    "Device belongs to our integration via identifier: %s", identifier
-                )
-                break
-
-        if not device_belongs_to_integration:
-            _LOGGER.error("Device %s is not an AMPECO EV Charger", device_id)
-            _LOGGER.error(
-                "Device identifiers: %s, DOMAIN: %s", device.identifiers, DOMAIN
-            )
-            raise ValueError(f"Device {device_id} is not an AMPECO EV Charger")
-
-        # Get the coordinator for this device
-        try:
-            # Find a config entry for this device that belongs to our integration
-            # and has a coordinator in the hass.data dictionary
-            coordinator = None
-            for entry_id in device.config_entries:
-                # Check if this entry exists in our data dictionary
-                if entry_id in hass.data.get(DOMAIN, {}):
-                    coordinator = hass.data[DOMAIN][entry_id]
-                    _LOGGER.debug("Found coordinator using entry_id: %s", entry_id)
-                    break
-
-            if not coordinator:
-                _LOGGER.error(
-                    "Failed to find coordinator for device %s. No matching entry in hass.data[DOMAIN]",
-                    device_id,
-                )
-                raise ValueError(
-                    f"Failed to get controller for device {device_id}: No matching entry found"
-                )
-        except Exception as err:
-            _LOGGER.error(
-                "Failed to find coordinator for device %s: %s", device_id, err
-            )
-            raise ValueError(
-                f"Failed to get controller for device {device_id}"
-            ) from err
-
-        # Get the EVSE ID from the device identifiers
-        try:
-            evse_id = next(
-                (ident[1] for ident in device.identifiers if ident[0] == DOMAIN), None
-            )
-            if not evse_id:
-                _LOGGER.error("No EVSE ID found for device %s", device_id)
-                raise ValueError(f"No EVSE ID found for device {device_id}")
-        except Exception as err:
-            _LOGGER.error("Error getting EVSE ID: %s", err)
-            raise ValueError("Failed to get EVSE ID") from err
+        coordinator, evse_id = _resolve_device_coordinator(hass, call)
 
         # Get max_current from call data if provided
         max_current = call.data.get("max_current")
@@ -151,77 +120,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     async def handle_stop_charging(call: ServiceCall) -> None:
         """Handle the stop charging service call."""
         _LOGGER.debug("Stop charging service called with: %s", call.data)
-
-        # Get device_id from call data
-        device_id = call.data.get("device_id")
-        if not device_id:
-            _LOGGER.error("No device_id provided in service call")
-            raise ValueError("No device_id provided in service call data")
-
-        device_registry = dr.async_get(hass)
-        device = device_registry.async_get(device_id)
-
-        if not device:
-            _LOGGER.error("Device %s not found", device_id)
-            raise ValueError(f"Device {device_id} not found")
-
-        # Add detailed debug logging
-        _LOGGER.debug("Found device: %s", device)
-        _LOGGER.debug("Device config entries: %s", device.config_entries)
-        _LOGGER.debug("Device identifiers: %s", device.identifiers)
-        _LOGGER.debug("DOMAIN: %s", DOMAIN)
-
-        # Check each config entry and log details
-        for entry_id in device.config_entries:
-            _LOGGER.debug("Checking entry: %s", entry_id)
-            _LOGGER.debug("Entry domain part: %s", entry_id.split(".")[0])
-
-        # Verify the device belongs to our integration by checking identifiers
-        # A device belongs to our integration if it has an identifier with our domain
-        device_belongs_to_integration = False
-        for domain, identifier in device.identifiers:
-            _LOGGER.debug("Checking identifier domain: %s", domain)
-            if domain == DOMAIN:
-                device_belongs_to_integration = True
-                _LOGGER.debug(
-                    "Device belongs to our integration via identifier: %s", identifier
-                )
-                break
-
-        if not device_belongs_to_integration:
-            _LOGGER.error("Device %s is not an AMPECO EV Charger", device_id)
-            _LOGGER.error(
-                "Device identifiers: %s, DOMAIN: %s", device.identifiers, DOMAIN
-            )
-            raise ValueError(f"Device {device_id} is not an AMPECO EV Charger")
-
-        # Get the coordinator for this device
-        try:
-            # Find a config entry for this device that belongs to our integration
-            # and has a coordinator in the hass.data dictionary
-            coordinator = None
-            for entry_id in device.config_entries:
-                # Check if this entry exists in our data dictionary
-                if entry_id in hass.data.get(DOMAIN, {}):
-                    coordinator = hass.data[DOMAIN][entry_id]
-                    _LOGGER.debug("Found coordinator using entry_id: %s", entry_id)
-                    break
-
-            if not coordinator:
-                _LOGGER.error(
-                    "Failed to find coordinator for device %s. No matching entry in hass.data[DOMAIN]",
-                    device_id,
-                )
-                raise ValueError(
-                    f"Failed to get controller for device {device_id}: No matching entry found"
-                )
-        except Exception as err:
-            _LOGGER.error(
-                "Failed to find coordinator for device %s: %s", device_id, err
-            )
-            raise ValueError(
-                f"Failed to get controller for device {device_id}"
-            ) from err
+        coordinator, _ = _resolve_device_coordinator(hass, call)
 
         try:
             await coordinator.stop_charging()
@@ -232,76 +131,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     async def handle_update_data(call: ServiceCall) -> None:
         """Handle the update data service call."""
         _LOGGER.debug("Update data service called with: %s", call.data)
+        coordinator, _ = _resolve_device_coordinator(hass, call)
 
-        # Get device_id from call data
-        device_id = call.data.get("device_id")
-        if not device_id:
-            _LOGGER.error("No device_id provided in service call")
-            raise ValueError("No device_id provided in service call data")
-
-        device_registry = dr.async_get(hass)
-        device = device_registry.async_get(device_id)
-
-        if not device:
-            _LOGGER.error("Device %s not found", device_id)
-            raise ValueError(f"Device {device_id} not found")
-
-        # Add detailed debug logging
-        _LOGGER.debug("Found device for update_data: %s", device)
-        _LOGGER.debug(
-            "Device config entries for update_data: %s", device.config_entries
-        )
-        _LOGGER.debug("Device identifiers for update_data: %s", device.identifiers)
-        _LOGGER.debug("DOMAIN: %s", DOMAIN)
-
-        # Verify the device belongs to our integration by checking identifiers
-        # A device belongs to our integration if it has an identifier with our domain
-        device_belongs_to_integration = False
-        for domain, identifier in device.identifiers:
-            _LOGGER.debug("Checking identifier domain for update_data: %s", domain)
-            if domain == DOMAIN:
-                device_belongs_to_integration = True
-                _LOGGER.debug(
-                    "Device belongs to our integration via identifier: %s", identifier
-                )
-                break
-
-        if not device_belongs_to_integration:
-            _LOGGER.error("Device %s is not an AMPECO EV Charger", device_id)
-            _LOGGER.error(
-                "Device identifiers: %s, DOMAIN: %s", device.identifiers, DOMAIN
-            )
-            raise ValueError(f"Device {device_id} is not an AMPECO EV Charger")
-
-        # Get the coordinator for this device
-        try:
-            # Find a config entry for this device that belongs to our integration
-            # and has a coordinator in the hass.data dictionary
-            coordinator = None
-            for entry_id in device.config_entries:
-                # Check if this entry exists in our data dictionary
-                if entry_id in hass.data.get(DOMAIN, {}):
-                    coordinator = hass.data[DOMAIN][entry_id]
-                    _LOGGER.debug("Found coordinator using entry_id: %s", entry_id)
-                    break
-
-            if not coordinator:
-                _LOGGER.error(
-                    "Failed to find coordinator for device %s. No matching entry in hass.data[DOMAIN]",
-                    device_id,
-                )
-                raise ValueError(
-                    f"Failed to get controller for device {device_id}: No matching entry found"
-                )
-        except Exception as err:
-            _LOGGER.error(
-                "Failed to find coordinator for device %s: %s", device_id, err
-            )
-            raise ValueError(
-                f"Failed to get controller for device {device_id}"
-            ) from err
-
-        _LOGGER.debug("Manual update triggered for device %s", device_id)
         try:
             await coordinator.manual_update_evse_status()
         except Exception as err:
@@ -331,6 +162,18 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    # The sensors have now registered the device; index it so service calls
+    # resolve their coordinator with a single lookup
+    evse_id = entry.data[CONF_EVSE_ID]
+    device = dr.async_get(hass).async_get_device(identifiers={(DOMAIN, evse_id)})
+    if device:
+        hass.data[DOMAIN].setdefault(DEVICE_INDEX, {})[device.id] = (
+            coordinator,
+            evse_id,
+        )
+    else:
+        _LOGGER.warning("No device registered for EVSE %s", evse_id)
+
     return True
 
 
@@ -338,10 +181,20 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        await coordinator.async_shutdown()
+
+        # Drop index entries pointing at the unloaded coordinator
+        device_index = hass.data[DOMAIN].get(DEVICE_INDEX, {})
+        for device_id in [
+            device_id
+            for device_id, (indexed, _) in device_index.items()
+            if indexed is coordinator
+        ]:
+            del device_index[device_id]
 
         # Remove services if this is the last config entry
-        if not hass.data[DOMAIN]:
+        if not any(key != DEVICE_INDEX for key in hass.data[DOMAIN]):
             for service in [
                 SERVICE_START_CHARGING,
                 SERVICE_STOP_CHARGING,
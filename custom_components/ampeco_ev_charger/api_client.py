@@ -2,69 +2,173 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
 import aiohttp
-import async_timeout
-from typing import Any, Optional
+from aiohttp import hdrs
+from multidict import CIMultiDict
+from typing import Any, Awaitable, Callable, Optional
 
-from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 
 from .base_api_client import BaseApiClient
-from .exceptions import ConnectionError, AlreadyChargingError
+from .const import STATUS_CACHE_TTL
+from .exceptions import AlreadyChargingError
 
 _LOGGER = logging.getLogger(__name__)
-# Uncomment this line to enable debug logging for this integration
-logging.getLogger(__name__).setLevel(logging.DEBUG)
+
+
+def parse_evse_status(payload: dict[str, Any]) -> tuple[str, dict[str, Any]]:
+    """Return the status and embedded session of the first EVSE.
+
+    The status is "unknown" if the payload has no EVSE, and the session is
+    empty unless the EVSE carries one with an ID.
+    """
+    try:
+        evse = payload["data"]["evses"][0]
+    except (KeyError, IndexError, TypeError):
+        return "unknown", {}
+    session = evse.get("session") or {}
+    return evse.get("status", "unknown"), session if "id" in session else {}
 
 
 class EVChargerApiClient(BaseApiClient):
     """AMPECO EV Charger API client."""
 
+    __slots__ = (
+        "_chargepoint_id",
+        "_status_endpoint",
+        "_auth_token",
+        "_headers",
+        "_active_session_id",
+        "_status_cache",
+        "_status_ttl",
+        "_status_generation",
+        "_inflight",
+    )
+
     def __init__(
         self,
         host: str,
         chargepoint_id: str,
         auth_token: str,
         session: aiohttp.ClientSession,
+        status_ttl: float = STATUS_CACHE_TTL,
     ) -> None:
         """Initialize the API client."""
         super().__init__(host, session)
         self._chargepoint_id = chargepoint_id
+        self._status_endpoint = f"app/personal/charge-points/{chargepoint_id}"
         self._auth_token = auth_token
-        self._headers = {
-            "Authorization": f"Bearer {auth_token}",
-            "Content-Type": "application/json",
-        }
+        # Built once and passed by reference to every request
+        self._headers = CIMultiDict(
+            (
+                (hdrs.AUTHORIZATION, f"Bearer {auth_token}"),
+                (hdrs.CONTENT_TYPE, "application/json"),
+            )
+        )
         self._active_session_id: str | None = None
+        self._status_cache: tuple[float, dict[str, Any]] | None = None
+        self._status_ttl = status_ttl
+        # Bumped on invalidation so reads started before a write are not cached
+        self._status_generation = 0
+        self._inflight: dict[str, asyncio.Future] = {}
+
+    async def _single_flight(
+        self, key: str, fetch: Callable[[], Awaitable[dict[str, Any]]]
+    ) -> dict[str, Any]:
+        """Run fetch once for all concurrent callers sharing the same key."""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fetch())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._forget_inflight(key, done))
+        else:
+            _LOGGER.debug("Joining in-flight %s request", key)
+        # Shield so one caller being cancelled does not abort the shared request
+        return await asyncio.shield(task)
+
+    def _forget_inflight(self, key: str, task: asyncio.Future) -> None:
+        """Drop a finished request unless a newer one has replaced it."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+
+    async def get_chargepoints(self) -> dict[str, Any]:
+        """Get all charge points available to the token."""
+        return await self._make_request(
+            "GET", "app/personal/charge-points", headers=self._headers
+        )
 
     async def get_charger_status(self) -> dict[str, Any]:
-        """Get charger status."""
-        return await self._make_request(
+        """Get charger status.
+
+        Responses are cached for a short time so the reads made within one
+        update (status plus the session derived from it) hit the API once.
+        """
+        if self._status_cache is not None:
+            fetched_at, cached = self._status_cache
+            if time.monotonic() - fetched_at < self._status_ttl:
+                _LOGGER.debug("Returning cached charger status")
+                return cached
+
+        return await self._single_flight("status", self._fetch_charger_status)
+
+    async def _fetch_charger_status(self) -> dict[str, Any]:
+        """Fetch charger status from the API and refresh the cache."""
+        generation = self._status_generation
+        status = await self._make_request(
             "GET",
-            f"app/personal/charge-points/{self._chargepoint_id}",
+            self._status_endpoint,
             headers=self._headers,
         )
+        if generation == self._status_generation:
+            self._status_cache = (time.monotonic(), status)
+            # Track the embedded session so stop_charging never uses a stale ID
+            self._active_session_id = parse_evse_status(status)[1].get("id")
+        return status
+
+    @property
+    def active_session_id(self) -> str | None:
+        """Return the ID of the last seen active session, if any."""
+        return self._active_session_id
+
+    def invalidate_status_cache(self) -> None:
+        """Drop the cached charger status so the next read hits the API.
+
+        Lookups still in flight were sent before the caller's write; they are
+        detached so later reads start a fresh request, and their result is
+        not cached.
+        """
+        self._status_cache = None
+        self._status_generation += 1
+        self._inflight.pop("status", None)
+        self._inflight.pop("session", None)
 
     async def get_active_session(self) -> dict[str, Any]:
         """Get active charging session from charge point info.
 
         The app/session/active endpoint is no longer available, so we retrieve
-        session data directly from the charge point info.
+        session data directly from the charge point info. Concurrent callers
+        share a single lookup.
         """
+        return await self._single_flight("session", self._fetch_active_session)
+
+    async def _fetch_active_session(self) -> dict[str, Any]:
+        """Extract the active session from the charge point info."""
         try:
             charger_status = await self.get_charger_status()
-            evse = charger_status.get("data", {}).get("evses", [{}])[0]
-            session_data = evse.get("session", {})
-
-            if session_data and "id" in session_data:
-                _LOGGER.debug(
-                    "Found session in charge point info: %s, power: %s, energy: %s, duration: %s seconds",
-                    session_data["id"],
-                    session_data.get("power"),
-                    session_data.get("energy"),
-                    session_data.get("duration"),
-                )
+            _, session_data = parse_evse_status(charger_status)
+
+            if session_data:
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug(
+                        "Found session in charge point info: %s, power: %s, energy: %s, duration: %s seconds",
+                        session_data["id"],
+                        session_data.get("power"),
+                        session_data.get("energy"),
+                        session_data.get("duration"),
+                    )
                 self._active_session_id = session_data["id"]
                 return {"session": session_data}
             else:
@@ -72,7 +176,7 @@ class EVChargerApiClient(BaseApiClient):
                 self._active_session_id = None
                 return {}
         except Exception as err:
-            _LOGGER.error("Failed to get session from charge point info: %s", str(err))
+            _LOGGER.error("Failed to get session from charge point info: %s", err)
             self._active_session_id = None
             return {}
 
@@ -85,18 +189,6 @@ class EVChargerApiClient(BaseApiClient):
             evse_id: The ID of the EVSE to start charging
             max_current: Optional maximum charging current in amperes (6-32A)
         """
-        # First check if there's already an active session
-        active_session = await self.get_active_session()
-        if active_session and active_session.get("session"):
-            session_data = active_session.get("session", {})
-            session_id = session_data.get("id")
-            _LOGGER.info(
-                "Session already active with ID: %s, returning existing session data",
-                session_id,
-            )
-            self._active_session_id = session_id
-            return session_data
-
         payload = {"evseId": evse_id}
 
         # Add max_current to the payload if provided
@@ -107,24 +199,32 @@ class EVChargerApiClient(BaseApiClient):
             response = await self._make_request(
                 "POST", "app/session/start", headers=self._headers, json_data=payload
             )
-            session_data = response.get("session", {})
-            if session_data:
+            self.invalidate_status_cache()
+            if session_data := response.get("session"):
                 self._active_session_id = session_data.get("id")
-            return session_data
+                return session_data
+            return {}
         except AlreadyChargingError:
-            # If we get here, our initial check missed an active session
-            # Try to get the session data again
+            # The charger already has a session, fetch it instead of failing.
+            # Only this rare path pays for the extra lookup.
             _LOGGER.info("Got AlreadyChargingError, fetching current session data")
-            active_session = await self.get_active_session()
-            if active_session and active_session.get("session"):
-                session_data = active_session.get("session", {})
+            self.invalidate_status_cache()
+            if session_data := (await self.get_active_session()).get("session"):
                 self._active_session_id = session_data.get("id")
                 return session_data
             # If we still can't find a session, re-raise the error
             raise
 
-    async def stop_charging(self) -> dict[str, Any]:
-        """Stop charging session."""
+    async def stop_charging(self, session_id: str | None = None) -> dict[str, Any]:
+        """Stop charging session.
+
+        Args:
+            session_id: Optional session ID already known to the caller, used
+                when the client has not tracked one itself
+        """
+        if not self._active_session_id:
+            self._active_session_id = session_id
+
         if not self._active_session_id:
             # Get the latest session info directly
             await self.get_active_session()
@@ -138,11 +238,11 @@ class EVChargerApiClient(BaseApiClient):
                 f"app/session/{self._active_session_id}/end",
                 headers=self._headers,
             )
-            session_data = response.get("session", {})
+            self.invalidate_status_cache()
             self._active_session_id = None
-            return session_data
+            return response.get("session") or {}
         except Exception as err:
-            _LOGGER.error("Failed to stop charging session: %s", str(err))
+            _LOGGER.error("Failed to stop charging session: %s", err)
             # Always clear the session ID to avoid getting stuck
             self._active_session_id = None
             raise
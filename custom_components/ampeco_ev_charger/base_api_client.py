@@ -1,22 +1,75 @@
 """Base API client for AMPECO EV Charger."""
 
-from abc import ABC, abstractmethod
+from abc import ABC
+import asyncio
 import logging
-import async_timeout
 from typing import Any
 
-from .exceptions import AuthenticationError, ConnectionError, AlreadyChargingError
+import aiohttp
+from aiohttp import hdrs
+from multidict import CIMultiDict
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_create_clientsession
+import orjson
+
+from .const import DEFAULT_TIMEOUT
+from .exceptions import (
+    AmpecoConnectionError,
+    AuthenticationError,
+    AlreadyChargingError,
+    InvalidResponse,
+)
+
+
+def create_api_session(hass: HomeAssistant) -> aiohttp.ClientSession:
+    """Create an HTTP session for polling the AMPECO API.
+
+    The session runs on Home Assistant's shared connection pool, so all
+    entries reuse the same keep-alive connections. It sends the Home
+    Assistant user agent and is detached on shutdown or when the config
+    entry creating it unloads. It skips the cookie jar since the API
+    never sets cookies we need.
+    """
+    return async_create_clientsession(
+        hass,
+        cookie_jar=aiohttp.DummyCookieJar(),
+        timeout=aiohttp.ClientTimeout(total=DEFAULT_TIMEOUT),
+    )
 
 
 class BaseApiClient(ABC):
     """Base API client implementation."""
 
-    def __init__(self, host: str, session, timeout: int = 10):
-        """Initialize the base client."""
+    __slots__ = (
+        "_host",
+        "_base_url",
+        "_session",
+        "_timeout",
+        "_client_timeout",
+        "_logger",
+        "_etags",
+    )
+
+    def __init__(
+        self, host: str, session: aiohttp.ClientSession, timeout: int = 10
+    ):
+        """Initialize the base client.
+
+        The client never creates a session of its own; callers pass a
+        long-lived one so keep-alive connections are reused across requests.
+        """
+        if session is None:
+            raise ValueError("An aiohttp ClientSession is required")
         self._host = host.rstrip("/")
+        self._base_url = f"{self._host}/api/v1/"
         self._session = session
         self._timeout = timeout
+        # Let aiohttp enforce the timeout instead of wrapping every request
+        self._client_timeout = aiohttp.ClientTimeout(total=timeout)
         self._logger = logging.getLogger(__name__)
+        # Per GET endpoint: decoded body of the last ETag-tagged response and
+        # the request headers carrying If-None-Match, built once per ETag
+        self._etags: dict[str, tuple[dict[str, Any], CIMultiDict]] = {}
         self._logger.debug(
             "Initializing BaseApiClient with host: %s, timeout: %d",
             self._host,
@@ -31,52 +84,83 @@ class BaseApiClient(ABC):
         json_data: dict = None,
     ) -> dict[str, Any]:
         """Make authenticated request to the API."""
-        url = f"{self._host}/api/v1/{endpoint}"
-        self._logger.debug(
-            "Making %s request to %s with data: %s",
-            method,
-            url,
-            json_data if json_data else "None",
-        )
+        url = self._base_url + endpoint
+        debug = self._logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            self._logger.debug(
+                "Making %s request to %s with data: %s",
+                method,
+                url,
+                json_data if json_data else "None",
+            )
+
+        # Revalidate GETs with the last ETag so unchanged data costs no body
+        cached = self._etags.get(endpoint) if method == "GET" else None
+        if cached is not None:
+            headers = cached[1]
 
         try:
-            async with async_timeout.timeout(self._timeout):
-                response = await self._session.request(
-                    method,
-                    url,
-                    headers=headers,
-                    json=json_data,
-                )
-                self._logger.debug(
-                    "Response status: %d, headers: %s",
-                    response.status,
-                    response.headers,
-                )
-
-                if response.status == 401:
-                    self._logger.debug("Authentication failed")
-                    raise AuthenticationError("Invalid authentication")
-                if response.status == 404:
-                    self._logger.debug("Resource not found, returning empty dict")
-                    return {}
-
-                # Special handling for 406 errors when trying to start a charging session
-                if response.status == 406 and "session/start" in endpoint:
-                    self._logger.info(
-                        "Received 406 when starting session - likely already charging"
-                    )
-                    raise AlreadyChargingError(
-                        "Cannot start charging: A session is already active"
-                    )
-
-                response.raise_for_status()
-                data = await response.json()
-                self._logger.debug("Response data: %s", data)
-                return data
-
-        except AlreadyChargingError:
-            # Re-raise without wrapping in ConnectionError
-            raise
-        except Exception as err:
-            self._logger.error("API request failed: %s", str(err))
-            raise ConnectionError(f"Failed to connect: {err}") from err
+            response = await self._session.request(
+                method,
+                url,
+                headers=headers,
+                # Content-Type is already part of the client headers
+                data=orjson.dumps(json_data) if json_data is not None else None,
+                timeout=self._client_timeout,
+            )
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+            self._logger.error("API request failed: %s", err)
+            raise AmpecoConnectionError(f"Failed to connect: {err}") from err
+
+        if debug:
+            self._logger.debug(
+                "Response status: %d, headers: %s",
+                response.status,
+                response.headers,
+            )
+
+        if response.status == 304 and cached is not None:
+            if debug:
+                self._logger.debug("Not modified, reusing cached response")
+            return cached[0]
+        if response.status == 401:
+            self._logger.debug("Authentication failed")
+            raise AuthenticationError("Invalid authentication")
+        if response.status == 404:
+            self._logger.debug("Resource not found, returning empty dict")
+            return {}
+
+        # Special handling for 406 errors when trying to start a charging session
+        if response.status == 406 and "session/start" in endpoint:
+            self._logger.info(
+                "Received 406 when starting session - likely already charging"
+            )
+            raise AlreadyChargingError(
+                "Cannot start charging: A session is already active"
+            )
+
+        try:
+            response.raise_for_status()
+            body = await response.read()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+            self._logger.error("API request failed: %s", err)
+            raise AmpecoConnectionError(f"Failed to connect: {err}") from err
+
+        try:
+            # orjson ships with Home Assistant and is much faster than json
+            data = orjson.loads(body)
+        except orjson.JSONDecodeError as err:
+            self._logger.error("API returned invalid JSON: %s", err)
+            raise InvalidResponse(f"Invalid JSON response: {err}") from err
+
+        if method == "GET" and (etag := response.headers.get(hdrs.ETAG)):
+            if cached is None or cached[1][hdrs.IF_NONE_MATCH] != etag:
+                revalidate = CIMultiDict(headers or ())
+                revalidate[hdrs.IF_NONE_MATCH] = etag
+            else:
+                revalidate = cached[1]
+            self._etags[endpoint] = (data, revalidate)
+
+        if debug:
+            self._logger.debug("Response data: %s", data)
+        return data
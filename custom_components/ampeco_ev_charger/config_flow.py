@@ -5,7 +5,6 @@ from __future__ import annotations
 import logging
 from typing import Any
 
-import aiohttp
 import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.core import HomeAssistant
@@ -14,6 +13,7 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .api_client import EVChargerApiClient
+from .exceptions import AmpecoConnectionError, AuthenticationError
 from .const import (
     DOMAIN,
     CONF_AUTH_TOKEN,
@@ -47,9 +47,7 @@ async def validate_auth(
 
     try:
         _LOGGER.debug("Attempting to get chargepoints list")
-        response = await client._make_request(
-            "GET", "app/personal/charge-points", headers=client._headers
-        )
+        response = await client.get_chargepoints()
         _LOGGER.debug("Received chargepoints: %s", response)
 
         if not response or "data" not in response:
@@ -61,10 +59,11 @@ async def validate_auth(
 
         return chargepoints
 
-    except aiohttp.ClientResponseError as err:
+    except AuthenticationError as err:
+        _LOGGER.error("Authentication failed during validation: %s", err)
+        raise InvalidAuth from err
+    except AmpecoConnectionError as err:
         _LOGGER.error("HTTP error during validation: %s", err)
-        if err.status == 401:
-            raise InvalidAuth from err
         raise CannotConnect from err
     except Exception as err:
         _LOGGER.exception("Unexpected error during validation: %s", err)
@@ -81,6 +80,8 @@ class EVChargerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self._host: str | None = None
         self._token: str | None = None
         self._chargepoints: list[dict[str, Any]] | None = None
+        self._chargepoints_by_id: dict[str, dict[str, Any]] = {}
+        self._select_schema: vol.Schema | None = None
 
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
@@ -99,6 +100,18 @@ class EVChargerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 self._host = user_input[CONF_API_HOST]
                 self._token = user_input[CONF_AUTH_TOKEN]
                 self._chargepoints = chargepoints
+                self._chargepoints_by_id = {cp["id"]: cp for cp in chargepoints}
+                # Build the selection schema once; re-shows of the form reuse it
+                self._select_schema = vol.Schema(
+                    {
+                        vol.Required(CONF_CHARGEPOINT_ID): vol.In(
+                            {
+                                cp_id: f"{cp['name']} ({cp_id})"
+                                for cp_id, cp in self._chargepoints_by_id.items()
+                            }
+                        )
+                    }
+                )
 
                 return await self.async_step_select_chargepoint()
 
@@ -125,16 +138,13 @@ class EVChargerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         errors: dict[str, str] = {}
 
         if user_input is not None:
-            chargepoint = next(
-                (
-                    cp
-                    for cp in self._chargepoints
-                    if cp["id"] == user_input[CONF_CHARGEPOINT_ID]
-                ),
-                None,
+            chargepoint = self._chargepoints_by_id.get(
+                user_input[CONF_CHARGEPOINT_ID]
             )
             if chargepoint:
-                evse = chargepoint["evses"][0] if chargepoint.get("evses") else None
+                evse = next(
+                    (e for e in chargepoint.get("evses") or () if e.get("id")), None
+                )
                 if evse:
                     return self.async_create_entry(
                         title=f"AMPECO EV Charger {chargepoint['name']}",
@@ -146,15 +156,9 @@ class EVChargerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                         },
                     )
 
-        chargepoint_options = {
-            cp["id"]: f"{cp['name']} ({cp['id']})" for cp in self._chargepoints
-        }
-
         return self.async_show_form(
             step_id="select_chargepoint",
-            data_schema=vol.Schema(
-                {vol.Required(CONF_CHARGEPOINT_ID): vol.In(chargepoint_options)}
-            ),
+            data_schema=self._select_schema,
             errors=errors,
         )
 
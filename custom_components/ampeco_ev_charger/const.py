@@ -5,6 +5,11 @@ from datetime import timedelta
 DOMAIN = "ampeco_ev_charger"
 SCAN_INTERVAL = timedelta(seconds=30)
 IDLE_SCAN_INTERVAL = timedelta(minutes=5)
+ACTIVE_SESSION_INTERVAL = timedelta(seconds=30)
+ACTIVE_SESSION_MAX_INTERVAL = timedelta(minutes=2)
+# Polls kept at SCAN_INTERVAL after an EVSE status change, since one
+# transition (e.g. plugged in) is usually followed by another soon after
+TRANSITION_FAST_POLLS = 4
 
 # API
 DEFAULT_API_HOST = "https://vendor.eu.charge.ampeco.tech"
@@ -15,10 +20,16 @@ CONF_CHARGEPOINT_ID = "chargepoint_id"
 CONF_AUTH_TOKEN = "auth_token"
 CONF_EVSE_ID = "evse_id"
 
+# hass.data[DOMAIN] key mapping device IDs to (coordinator, evse_id)
+DEVICE_INDEX = "_device_index"
+
 # Sensor types
 SENSOR_TYPE_CHARGER_STATUS = "charger_status"
 SENSOR_TYPE_CHARGING_SESSION = "charging_session"
 
+# EVSE statuses during which a session is polled
+ACTIVE_EVSE_STATUSES = frozenset({"charging", "preparing"})
+
 # Service names
 SERVICE_START_CHARGING = "start_charging"
 SERVICE_STOP_CHARGING = "stop_charging"
@@ -32,3 +43,10 @@ DEFAULT_TIMEOUT = 10
 MAX_RETRIES = 3
 MIN_TIME_BETWEEN_RETRIES = timedelta(seconds=30)
 BACKOFF_MULTIPLIER = 2
+# Upper bound for the error backoff before jitter; kept once retries run out
+MAX_BACKOFF_INTERVAL = timedelta(minutes=5)
+
+# Charger status responses younger than this (seconds) are served from memory.
+# Long enough to collapse the reads within one update, short enough that a
+# manual refresh always sees fresh data.
+STATUS_CACHE_TTL = 1.5
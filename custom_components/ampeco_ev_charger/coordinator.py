@@ -1,26 +1,77 @@
 """DataUpdateCoordinator for EV Charger."""
 
-from datetime import timedelta, datetime
+from datetime import datetime
+from functools import cached_property
 import logging
-import asyncio
 from typing import Any, Optional
 
-from homeassistant.core import HomeAssistant
+import orjson
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
     UpdateFailed,
 )
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
-from .const import DOMAIN, SCAN_INTERVAL, DEFAULT_TIMEOUT, IDLE_SCAN_INTERVAL
-from .api_client import EVChargerApiClient
+from .const import (
+    ACTIVE_EVSE_STATUSES,
+    ACTIVE_SESSION_INTERVAL,
+    ACTIVE_SESSION_MAX_INTERVAL,
+    DOMAIN,
+)
+from .api_client import EVChargerApiClient, parse_evse_status
+from .base_api_client import create_api_session
 from .retry import AdaptivePollingStrategy
-from .exceptions import AuthenticationError, NoActiveSessionError, AlreadyChargingError
+from .exceptions import (
+    AmpecoEVChargerError,
+    AuthenticationError,
+    AlreadyChargingError,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def _normalize_session(session: dict[str, Any]) -> dict[str, Any]:
+    """Return a copy of the session with power, energy and duration normalized.
+
+    Depending on the charger the API reports W/Wh or kW/kWh; converting once
+    per poll keeps the sensors from doing it on every state read.
+    """
+    if not session:
+        return session
+
+    # If power is more than 1000 it is in watts
+    try:
+        power = float(session.get("power", 0))
+    except (ValueError, TypeError):
+        power = 0
+    if power > 1000:
+        power = power / 1000
+
+    # If energy is more than 100 it is in Wh
+    try:
+        energy = float(session.get("energy", 0))
+    except (ValueError, TypeError):
+        energy = 0
+    if energy > 100:
+        energy = energy / 1000
+
+    # The API reports the duration in seconds
+    try:
+        duration_min = round(int(session.get("duration", 0)) / 60)
+    except (ValueError, TypeError):
+        duration_min = 0
+
+    return {
+        **session,
+        "power_kw": round(power, 2),
+        "energy_kwh": round(energy, 2),
+        "duration_min": duration_min,
+    }
+
+
 class EVChargerDataUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage fetching data from the API."""
 
@@ -38,41 +89,85 @@ class EVChargerDataUpdateCoordinator(DataUpdateCoordinator):
             _LOGGER,
             name=DOMAIN,
             update_interval=self.polling_strategy.update_interval,
+            # Polls usually return the same JSON; skip listener updates then
+            always_update=False,
         )
 
         self.config_entry = config_entry
+        self.chargepoint_id: str = config_entry.data["chargepoint_id"]
+        self.evse_id: str = config_entry.data["evse_id"]
+        # Detached by Home Assistant when the entry unloads or on shutdown
+        self._session = create_api_session(hass)
         self.api_client = self._create_client(hass, config_entry)
 
         # Initialize variables for active session polling
-        self._active_session_task: asyncio.Task | None = None
-        self._active_session_interval = timedelta(seconds=30)
-        self._active_session_running = False
+        self._active_session_unsub: CALLBACK_TYPE | None = None
+        self._active_session_interval = ACTIVE_SESSION_INTERVAL
+        # Serialized charger status from the previous session poll
+        self._last_status_body: bytes | None = None
 
     def _create_client(self, hass: HomeAssistant, config_entry) -> EVChargerApiClient:
         """Create API client instance."""
         return EVChargerApiClient(
             host=config_entry.data["api_host"],
-            chargepoint_id=config_entry.data["chargepoint_id"],
+            chargepoint_id=self.chargepoint_id,
             auth_token=config_entry.data["auth_token"],
-            session=async_get_clientsession(hass),
+            session=self._session,
+        )
+
+    @cached_property
+    def charger_name(self) -> str:
+        """Return the user-facing charger name."""
+        return self.data["status"].get(
+            "name", f"AMPECO Charger {self.chargepoint_id}"
+        )
+
+    @cached_property
+    def unique_id_prefix(self) -> str:
+        """Return the prefix shared by the unique IDs of this charger's entities."""
+        return f"{self.chargepoint_id}_{self.evse_id}_"
+
+    @cached_property
+    def device_info(self) -> DeviceInfo:
+        """Return the device info shared by all entities of this charger.
+
+        Built once after the first refresh; device identifiers must stay
+        stable because services find the device by them.
+        """
+        charger_data = self.data["status"]
+        try:
+            model = charger_data["evses"][0]["connectors"][0].get("name", "Unknown")
+        except (KeyError, IndexError, TypeError):
+            model = "Unknown"
+        return DeviceInfo(
+            identifiers={(DOMAIN, self.evse_id)},
+            name=self.charger_name,
+            manufacturer="AMPECO",
+            model=model,
+            sw_version=charger_data.get("firmware_version"),
+            configuration_url=(
+                f"https://app.ampeco.global/chargers/{self.chargepoint_id}"
+            ),
         )
 
+    async def async_shutdown(self) -> None:
+        """Stop session polling on unload."""
+        await super().async_shutdown()
+        self._stop_active_session_polling()
+
     async def _async_update_data(self) -> dict[str, Any]:
         """Update data via library."""
         try:
             _LOGGER.debug("Fetching charger status")
             charger_status = await self.api_client.get_charger_status()
+            self.polling_strategy.mark_success()
 
-            # Extract EVSE status
-            evse = charger_status.get("data", {}).get("evses", [{}])[0]
-            evse_status = evse.get("status", "unknown")
-
-            # Get session data directly from charge_point info
-            active_session = await self.api_client.get_active_session()
-            has_session = bool(active_session.get("session", {}))
+            # The charge point info embeds the session, no extra request needed
+            evse_status, session = parse_evse_status(charger_status)
+            is_charging = evse_status in ACTIVE_EVSE_STATUSES
 
             # Start or stop session polling based on EVSE status and session existence
-            if has_session and evse_status in ["charging", "preparing"]:
+            if session and is_charging:
                 _LOGGER.debug("Active session detected with status: %s", evse_status)
                 self._start_active_session_polling()
             else:
@@ -80,29 +175,41 @@ class EVChargerDataUpdateCoordinator(DataUpdateCoordinator):
                 self._stop_active_session_polling()
 
             # Update polling strategy based on charging status
-            is_charging = evse_status in ["charging", "preparing"]
-            self.polling_strategy.update_charging_state(is_charging)
-
-            # Update the coordinator's update interval
-            old_interval = self.update_interval
-            self.update_interval = self.polling_strategy.update_interval
-            _LOGGER.debug(
-                "Updated coordinator interval: %s -> %s",
-                old_interval,
-                self.update_interval,
-            )
+            self.polling_strategy.update_charging_state(is_charging, evse_status)
 
-            return {
+            data = {
                 "status": charger_status.get("data", {}),
-                "session": active_session.get("session", {}),
+                "session": _normalize_session(session),
             }
 
+            # Update the coordinator's update interval
+            new_interval = self.polling_strategy.update_interval
+            if new_interval != self.update_interval:
+                _LOGGER.debug(
+                    "Updated coordinator interval: %s -> %s",
+                    self.update_interval,
+                    new_interval,
+                )
+                self.update_interval = new_interval
+                # always_update=False skips listeners for an unchanged payload,
+                # but the polling interval sensor still has to show the change
+                if data == self.data:
+                    self.async_update_listeners()
+
+            return data
+
         except AuthenticationError as err:
-            _LOGGER.error("Authentication failed: %s", str(err))
+            _LOGGER.error("Authentication failed: %s", err)
             raise ConfigEntryAuthFailed from err
-        except Exception as err:
-            _LOGGER.error("Update failed: %s", str(err))
-            await self.polling_strategy.handle_error(err)
+        except AmpecoEVChargerError as err:
+            # Transport and API errors; anything else is a bug and should not
+            # feed the retry backoff
+            _LOGGER.error("Update failed: %s", err)
+            try:
+                self.polling_strategy.handle_error(err)
+            finally:
+                # Schedule the next tick according to the error backoff
+                self.update_interval = self.polling_strategy.update_interval
             raise UpdateFailed(f"Update failed: {err}") from err
 
     async def start_charging(
@@ -115,35 +222,59 @@ class EVChargerDataUpdateCoordinator(DataUpdateCoordinator):
             max_current: Optional maximum charging current in amperes (6-32A)
         """
         _LOGGER.debug(
-            f"Starting charging with EVSE ID: {evse_id}, max current: {max_current or 'default'}"
+            "Starting charging with EVSE ID: %s, max current: %s",
+            evse_id,
+            max_current or "default",
         )
         try:
             result = await self.api_client.start_charging(evse_id, max_current)
+            self.polling_strategy.mark_success()
             self.polling_strategy.update_charging_state(True)
-            await self.async_refresh()
+            # Poll the charger status at the charging interval from now on;
+            # publishing below schedules the next refresh with it
+            self.update_interval = self.polling_strategy.update_interval
+            if result:
+                # The start response already carries the session, publish it
+                # directly instead of polling both endpoints again
+                self.async_set_updated_data(
+                    {
+                        "status": (self.data or {}).get("status", {}),
+                        "session": _normalize_session(result),
+                    }
+                )
+            else:
+                await self.async_refresh()
             self._start_active_session_polling()
             return result
         except AlreadyChargingError as err:
             _LOGGER.info(
                 "Attempted to start charging but a session is already active: %s", err
             )
-            # We still want to refresh data and start polling
+            # Session polling picks up the running session, no refresh needed
             self.polling_strategy.update_charging_state(True)
-            await self.async_refresh()
+            self.update_interval = self.polling_strategy.update_interval
             self._start_active_session_polling()
             # Return the current session data
             return self.data.get("session", {})
 
     async def stop_charging(self) -> dict[str, Any]:
         """Stop charging session."""
+        # The last poll may predate a session started outside HA; without a
+        # known ID the client looks the session up itself
+        session = (self.data or {}).get("session")
+
         try:
-            result = await self.api_client.stop_charging()
+            # Hand over the polled session ID so the client can skip a lookup
+            result = await self.api_client.stop_charging(
+                session.get("id") if session else None
+            )
+            self.polling_strategy.mark_success()
             self.polling_strategy.update_charging_state(False)
             await self.async_refresh()
             self._stop_active_session_polling()
             return result
         except Exception as err:
-            _LOGGER.error("Error stopping charging session: %s", str(err))
+            _LOGGER.error("Error stopping charging session: %s", err)
             # Force update data to get latest state
             await self.async_refresh()
             # Still stop polling since we attempted to stop
@@ -152,65 +283,110 @@ class EVChargerDataUpdateCoordinator(DataUpdateCoordinator):
             # Re-raise the error for the service call handler
             raise
 
+    @callback
     def _start_active_session_polling(self) -> None:
-        """Start the active session polling loop."""
-        if not self._active_session_running:
-            _LOGGER.debug("Starting active session polling loop")
-            self._active_session_running = True
-            self._active_session_task = asyncio.create_task(self._active_session_loop())
+        """Start polling the active session."""
+        if self._active_session_unsub is None:
+            _LOGGER.debug("Starting active session polling")
+            self._active_session_interval = ACTIVE_SESSION_INTERVAL
+            self._last_status_body = None
+            self._track_active_session()
 
+    @callback
+    def _track_active_session(self) -> None:
+        """Schedule the session tick at the current interval."""
+        self._active_session_unsub = async_track_time_interval(
+            self.hass, self._async_active_session_tick, self._active_session_interval
+        )
+
+    @callback
     def _stop_active_session_polling(self) -> None:
-        """Stop the active session polling loop."""
-        if self._active_session_running and self._active_session_task:
-            _LOGGER.debug("Stopping active session polling loop")
-            self._active_session_task.cancel()
-            self._active_session_running = False
-
-    async def _active_session_loop(self) -> None:
-        """Loop to poll active session data every 30 seconds."""
-        while self._active_session_running:
-            try:
-                _LOGGER.debug("Fetching active session data")
-                active_session = await self.api_client.get_active_session()
-
-                if active_session and active_session.get("session"):
-                    session_data = active_session.get("session", {})
-                    self.data["session"] = session_data
-                    self.async_set_updated_data(self.data)
-
-                    # Check if still in a charging state
-                    charger_status = await self.api_client.get_charger_status()
-                    evse = charger_status.get("data", {}).get("evses", [{}])[0]
-                    evse_status = evse.get("status", "unknown")
-
-                    if evse_status not in ["charging", "preparing"]:
-                        _LOGGER.debug(
-                            "EVSE not in charging/preparing state - session might have ended"
-                        )
-                        self._stop_active_session_polling()
-                        await self.async_refresh()
-                        break
-                else:
-                    _LOGGER.debug("No session found, stopping active session polling")
-                    self._stop_active_session_polling()
-                    await self.async_refresh()
-                    break
-
-            except AuthenticationError as err:
-                _LOGGER.error(
-                    "Authentication failed during active session polling: %s", str(err)
+        """Stop polling the active session."""
+        if self._active_session_unsub is not None:
+            _LOGGER.debug("Stopping active session polling")
+            self._active_session_unsub()
+            self._active_session_unsub = None
+
+    async def _async_active_session_tick(self, _now: datetime) -> None:
+        """Poll active session data once while charging.
+
+        AMPECO offers no push channel for session telemetry, so the session is
+        polled every 30 seconds, backing off (up to two minutes) while
+        consecutive responses are identical, e.g. when the car paused charging.
+        """
+        try:
+            _LOGGER.debug("Fetching active session data")
+            # One status request per tick; the session is read from it
+            charger_status = await self.api_client.get_charger_status()
+            if self._active_session_unsub is None:
+                # Polling stopped (e.g. by stop_charging) while this tick was
+                # waiting; its response may predate the stop
+                return
+            evse_status, session_data = parse_evse_status(charger_status)
+
+            if not session_data or evse_status not in ACTIVE_EVSE_STATUSES:
+                _LOGGER.debug(
+                    "No session or EVSE not charging (%s), stopping active session polling",
+                    evse_status,
                 )
                 self._stop_active_session_polling()
-                raise ConfigEntryAuthFailed from err
-            except Exception as err:
-                _LOGGER.error("Error during active session polling: %s", str(err))
-                await self.polling_strategy.handle_error(err)
-                # Don't immediately break the polling loop on general errors
-                # It might be a temporary issue
+                await self.async_refresh()
+                return
+
+            interval = self._active_session_interval
+            status_data = charger_status.get("data", {})
+            # Only notify listeners when the status or session actually changed;
+            # the session is embedded in the status payload
+            if self._adapt_active_session_interval(status_data):
+                self.async_set_updated_data(
+                    {
+                        "status": status_data,
+                        "session": _normalize_session(session_data),
+                    }
+                )
+
+            if (
+                self._active_session_interval != interval
+                and self._active_session_unsub is not None
+            ):
+                self._active_session_unsub()
+                self._track_active_session()
+
+        except AuthenticationError as err:
+            _LOGGER.error(
+                "Authentication failed during active session polling: %s", err
+            )
+            self._stop_active_session_polling()
+            # Raising here would only fail the timer callback; let the regular
+            # update hit the same error and start reauthentication
+            await self.async_request_refresh()
+        except AmpecoEVChargerError as err:
+            # Keep polling, it might be a temporary issue; retry backoff is
+            # left to the regular update so service refreshes are not throttled
+            _LOGGER.warning("Error during active session polling: %s", err)
+
+    def _adapt_active_session_interval(self, status_data: dict[str, Any]) -> bool:
+        """Back off session polling while the charger status is unchanged.
 
-            await asyncio.sleep(self._active_session_interval.total_seconds())
+        Returns whether the status, including the embedded session, differs
+        from the previous tick.
+        """
+        body = orjson.dumps(status_data, option=orjson.OPT_SORT_KEYS)
+        if body == self._last_status_body:
+            self._active_session_interval = min(
+                self._active_session_interval * 2, ACTIVE_SESSION_MAX_INTERVAL
+            )
+            return False
+
+        self._active_session_interval = ACTIVE_SESSION_INTERVAL
+        self._last_status_body = body
+        return True
 
     async def manual_update_evse_status(self) -> None:
-        """Manually trigger a data update for EVSE status."""
+        """Manually trigger a data update for EVSE status.
+
+        Goes through the coordinator's debouncer, so a burst of calls results
+        in one refresh now and at most one more after the cooldown.
+        """
         _LOGGER.debug("Manually triggering EVSE status update")
-        await self.async_refresh()
+        await self.async_request_refresh()
@@ -17,12 +17,14 @@ async def async_get_config_entry_diagnostics(
     """Return diagnostics for a config entry."""
     coordinator = hass.data[DOMAIN][entry.entry_id]
 
-    diagnostics_data = {
-        "entry": async_redact_data(entry.as_dict(), TO_REDACT),
-        "data": {
-            "status": async_redact_data(coordinator.data["status"], TO_REDACT),
-            "session": async_redact_data(coordinator.data["session"], TO_REDACT),
+    # One recursive pass redacts the entry and the polled data together
+    return async_redact_data(
+        {
+            "entry": entry.as_dict(),
+            "data": {
+                "status": coordinator.data["status"],
+                "session": coordinator.data["session"],
+            },
         },
-    }
-
-    return diagnostics_data 
\ No newline at end of file
+        TO_REDACT,
+    )
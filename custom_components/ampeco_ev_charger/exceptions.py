@@ -9,7 +9,7 @@ class AuthenticationError(AmpecoEVChargerError):
     """Exception raised for authentication failures."""
 
 
-class ConnectionError(AmpecoEVChargerError):
+class AmpecoConnectionError(AmpecoEVChargerError):
     """Exception raised for connection failures."""
 
 
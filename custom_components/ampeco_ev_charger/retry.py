@@ -1,65 +1,120 @@
 """Retry strategy implementation."""
 from datetime import datetime, timedelta
 import logging
-from typing import Any, Optional
+import random
+from typing import NamedTuple, Optional
 
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import UpdateFailed
 
 from .const import (
+    MAX_BACKOFF_INTERVAL,
     MAX_RETRIES,
     MIN_TIME_BETWEEN_RETRIES,
     BACKOFF_MULTIPLIER,
     SCAN_INTERVAL,
     IDLE_SCAN_INTERVAL,
+    TRANSITION_FAST_POLLS,
 )
-from .exceptions import AmpecoEVChargerError, NoActiveSessionError
+from .exceptions import NoActiveSessionError
 
 _LOGGER = logging.getLogger(__name__)
 
+_MIN_SECONDS_BETWEEN_RETRIES = MIN_TIME_BETWEEN_RETRIES.total_seconds()
+
+
+class PollingSnapshot(NamedTuple):
+    """Read-only view of the polling state for diagnostics."""
+
+    is_charging: bool
+    retry_count: int
+    last_retry: Optional[datetime]
+
+
 class AdaptivePollingStrategy:
     """Handles adaptive polling intervals based on charging state."""
 
+    __slots__ = (
+        "hass",
+        "_retry_count",
+        "_last_retry",
+        "_last_retry_mono",
+        "update_interval",
+        "_is_charging",
+        "_evse_status",
+        "_fast_polls_left",
+    )
+
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize the strategy."""
         self.hass = hass
         self._retry_count = 0
         self._last_retry: Optional[datetime] = None
-        self._current_interval = SCAN_INTERVAL
+        # Monotonic loop time of the last retry, used for throttling
+        self._last_retry_mono: float | None = None
+        self.update_interval: timedelta = SCAN_INTERVAL
         self._is_charging = False
+        self._evse_status: str | None = None
+        self._fast_polls_left = 0
         _LOGGER.debug(
             "Initializing AdaptivePollingStrategy with initial interval: %s",
-            self._current_interval
+            self.update_interval
         )
 
-    def update_charging_state(self, has_active_session: bool) -> None:
-        """Update the charging state and adjust polling interval."""
+    def update_charging_state(
+        self, has_active_session: bool, evse_status: str | None = None
+    ) -> None:
+        """Update the charging state and adjust polling interval.
+
+        Args:
+            has_active_session: Whether the charger is charging or preparing
+            evse_status: The polled EVSE status; a change keeps the fast
+                interval for a few polls even when idle
+        """
         old_state = self._is_charging
-        old_interval = self._current_interval
-        
+        old_interval = self.update_interval
+
+        if evse_status is not None and evse_status != self._evse_status:
+            if self._evse_status is not None:
+                self._fast_polls_left = TRANSITION_FAST_POLLS
+            self._evse_status = evse_status
+        elif self._fast_polls_left:
+            self._fast_polls_left -= 1
+
         self._is_charging = has_active_session
-        self._current_interval = SCAN_INTERVAL if has_active_session else IDLE_SCAN_INTERVAL
+        self.update_interval = self._normal_interval()
         
         _LOGGER.debug(
             "Charging state changed: %s -> %s, interval: %s -> %s",
             old_state,
             self._is_charging,
             old_interval,
-            self._current_interval
+            self.update_interval
         )
 
-    async def handle_error(self, error: Exception) -> None:
+    @property
+    def snapshot(self) -> PollingSnapshot:
+        """Return the current polling state."""
+        return PollingSnapshot(self._is_charging, self._retry_count, self._last_retry)
+
+    def mark_success(self) -> None:
+        """Reset the retry state after a successful API call."""
+        self._retry_count = 0
+        self._last_retry = None
+        self._last_retry_mono = None
+
+    def handle_error(self, error: Exception) -> None:
         """Handle errors and implement retry logic."""
-        now = datetime.now()
-        _LOGGER.debug("Handling error: %s", str(error))
+        now = self.hass.loop.time()
+        _LOGGER.debug("Handling error: %s", error)
 
         if isinstance(error, NoActiveSessionError):
             _LOGGER.debug("No active session, updating charging state to False")
             self.update_charging_state(False)
             return None
 
-        if (self._last_retry and 
-            now - self._last_retry < MIN_TIME_BETWEEN_RETRIES):
+        if (self._last_retry_mono is not None and
+            now - self._last_retry_mono < _MIN_SECONDS_BETWEEN_RETRIES):
             _LOGGER.debug(
                 "Too many retries. Last retry: %s, minimum delay: %s",
                 self._last_retry,
@@ -68,26 +123,39 @@ class AdaptivePollingStrategy:
             raise UpdateFailed("Too many requests") from error
 
         self._retry_count += 1
-        self._last_retry = now
+        self._last_retry_mono = now
+        self._last_retry = datetime.now()
         _LOGGER.debug("Retry count increased to: %d", self._retry_count)
 
+        # Back off exponentially, then keep the capped delay once the retries
+        # are used up; never poll a failing API faster than the normal interval
+        if self._retry_count <= MAX_RETRIES:
+            backoff = min(
+                MIN_TIME_BETWEEN_RETRIES * (BACKOFF_MULTIPLIER ** (self._retry_count - 1)),
+                MAX_BACKOFF_INTERVAL,
+            )
+        else:
+            backoff = MAX_BACKOFF_INTERVAL
+        delay = max(self._normal_interval(), backoff)
+        # Jitter so instances hit by the same outage do not retry in lockstep
+        delay += delay * random.uniform(0, 0.25)
+        self.update_interval = delay
+
         if self._retry_count <= MAX_RETRIES:
-            delay = MIN_TIME_BETWEEN_RETRIES * (BACKOFF_MULTIPLIER ** (self._retry_count - 1))
             _LOGGER.warning(
                 "Update failed. Retry %d/%d in %s: %s",
                 self._retry_count,
                 MAX_RETRIES,
                 delay,
-                str(error),
+                error,
             )
             raise UpdateFailed("Temporary failure") from error
-        
-        _LOGGER.debug("Max retries exceeded, resetting retry count")
-        self._retry_count = 0
+
+        _LOGGER.debug("Max retries exceeded, next attempt in %s", delay)
         raise UpdateFailed("Update failed") from error
 
-    @property
-    def update_interval(self) -> timedelta:
-        """Get the current update interval."""
-        _LOGGER.debug("Current update interval: %s", self._current_interval)
-        return self._current_interval
\ No newline at end of file
+    def _normal_interval(self) -> timedelta:
+        """Return the polling interval for the current charging state."""
+        if self._is_charging or self._fast_polls_left:
+            return SCAN_INTERVAL
+        return IDLE_SCAN_INTERVAL
@@ -2,20 +2,23 @@
 from unittest.mock import patch
 import pytest
 
-from homeassistant.const import CONF_HOST
-from custom_components.ev_charger.const import (
-    DOMAIN,
+from custom_components.ampeco_ev_charger.const import (
     CONF_CHARGEPOINT_ID,
     CONF_AUTH_TOKEN,
     CONF_EVSE_ID,
     CONF_API_HOST,
 )
 
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Enable loading custom integrations in all tests."""
+    yield
+
 @pytest.fixture
 def mock_setup_entry() -> None:
     """Override async_setup_entry."""
     with patch(
-        "custom_components.ev_charger.async_setup_entry", return_value=True
+        "custom_components.ampeco_ev_charger.async_setup_entry", return_value=True
     ) as mock_setup_entry:
         yield mock_setup_entry
 
@@ -0,0 +1,128 @@
+"""Test AMPECO EV Charger API client."""
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from multidict import CIMultiDict
+import orjson
+
+from custom_components.ampeco_ev_charger.api_client import EVChargerApiClient
+
+
+def _mock_session(payload):
+    """Create a mock aiohttp session returning the given payload."""
+    response = MagicMock()
+    response.status = 200
+    response.headers = {}
+    response.read = AsyncMock(return_value=orjson.dumps(payload))
+    session = MagicMock()
+    session.request = AsyncMock(return_value=response)
+    return session
+
+
+def _client(session):
+    """Create an API client bound to the given session."""
+    return EVChargerApiClient(
+        host="https://app.ampeco.global",
+        chargepoint_id="test_chargepoint_id",
+        auth_token="test_auth_token",
+        session=session,
+    )
+
+
+async def test_charger_status_is_cached(mock_charger_status_response):
+    """Test repeated status reads within the TTL hit the API once."""
+    session = _mock_session(mock_charger_status_response)
+    client = _client(session)
+
+    first = await client.get_charger_status()
+    second = await client.get_charger_status()
+
+    assert first == second == mock_charger_status_response
+    assert session.request.await_count == 1
+
+
+async def test_charger_status_cache_expires(mock_charger_status_response):
+    """Test the status cache is bypassed once the TTL has elapsed."""
+    session = _mock_session(mock_charger_status_response)
+    client = _client(session)
+
+    # Replace the module's time reference only; patching time.monotonic
+    # itself would also move the event loop clock
+    with patch(
+        "custom_components.ampeco_ev_charger.api_client.time"
+    ) as mock_time:
+        mock_time.monotonic.return_value = 0
+        await client.get_charger_status()
+        mock_time.monotonic.return_value = client._status_ttl
+        await client.get_charger_status()
+
+    assert session.request.await_count == 2
+
+
+async def test_invalidate_status_cache(mock_charger_status_response):
+    """Test invalidation forces the next status read to hit the API."""
+    session = _mock_session(mock_charger_status_response)
+    client = _client(session)
+
+    await client.get_charger_status()
+    client.invalidate_status_cache()
+    await client.get_charger_status()
+
+    assert session.request.await_count == 2
+
+
+async def test_invalidate_detaches_inflight_status(mock_charger_status_response):
+    """Test a read started before invalidation is not joined afterwards."""
+    session = _mock_session(mock_charger_status_response)
+    release = asyncio.Event()
+    body = orjson.dumps(mock_charger_status_response)
+
+    async def slow_read():
+        await release.wait()
+        return body
+
+    session.request.return_value.read = AsyncMock(side_effect=slow_read)
+    client = _client(session)
+
+    stale = asyncio.ensure_future(client.get_charger_status())
+    await asyncio.sleep(0)
+    client.invalidate_status_cache()
+    fresh = asyncio.ensure_future(client.get_charger_status())
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(stale, fresh)
+
+    assert session.request.await_count == 2
+
+
+async def test_concurrent_reads_share_one_request(mock_charger_status_response):
+    """Test concurrent session and status reads issue a single request."""
+    session = _mock_session(mock_charger_status_response)
+    client = _client(session)
+
+    await asyncio.gather(
+        client.get_charger_status(),
+        client.get_active_session(),
+        client.get_active_session(),
+    )
+
+    assert session.request.await_count == 1
+
+
+async def test_not_modified_reuses_cached_body(mock_charger_status_response):
+    """Test a 304 response returns the body cached with the last ETag."""
+    session = _mock_session(mock_charger_status_response)
+    session.request.return_value.headers = CIMultiDict({"ETag": '"v1"'})
+    client = _client(session)
+    client._status_ttl = 0
+
+    first = await client.get_charger_status()
+
+    not_modified = MagicMock()
+    not_modified.status = 304
+    not_modified.headers = {}
+    session.request.return_value = not_modified
+    second = await client.get_charger_status()
+
+    assert second == first == mock_charger_status_response
+    assert session.request.call_args.kwargs["headers"]["If-None-Match"] == '"v1"'
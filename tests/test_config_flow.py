@@ -1,8 +1,7 @@
 """Test AMPECO EV Charger config flow."""
 from unittest.mock import patch
-import pytest
 from homeassistant import config_entries, data_entry_flow
-from custom_components.ev_charger.const import DOMAIN
+from custom_components.ampeco_ev_charger.const import DOMAIN
 
 async def test_form(hass, mock_charger_status_response):
     """Test we get the form."""
@@ -13,7 +12,7 @@ async def test_form(hass, mock_charger_status_response):
     assert result["errors"] == {}
 
     with patch(
-        "custom_components.ev_charger.config_flow.validate_input",
+        "custom_components.ampeco_ev_charger.config_flow.validate_input",
         return_value={"title": "AMPECO EV Charger Test", "evse_id": "test_evse_id"},
     ):
         result2 = await hass.config_entries.flow.async_configure(
@@ -39,7 +38,7 @@ async def test_form_invalid_auth(hass):
     )
 
     with patch(
-        "custom_components.ev_charger.config_flow.validate_input",
+        "custom_components.ampeco_ev_charger.config_flow.validate_input",
         side_effect=InvalidAuth,
     ):
         result2 = await hass.config_entries.flow.async_configure(
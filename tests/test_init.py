@@ -1,47 +1,101 @@
 """Test AMPECO EV Charger setup."""
-from homeassistant.exceptions import ConfigEntryNotReady
+from unittest.mock import MagicMock, patch
+
+from homeassistant.helpers import device_registry as dr
 import pytest
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
-from custom_components.ev_charger import (
+from custom_components.ampeco_ev_charger import (
+    _resolve_device_coordinator,
     async_setup_entry,
     async_unload_entry,
 )
-from custom_components.ev_charger.const import DOMAIN
+from custom_components.ampeco_ev_charger.const import CONF_EVSE_ID, DEVICE_INDEX, DOMAIN
+
+EMPTY_DATA = {"status": {}, "session": {}}
+CHARGING_DATA = {
+    "status": {
+        "name": "Test Charger",
+        "evses": [{"id": "test_evse_id", "status": "charging"}],
+    },
+    "session": {"id": "test_session_id", "power_kw": 11.0},
+}
+
+
+@pytest.fixture
+def patch_coordinator(request):
+    """Patch the coordinator update; parametrize indirectly to set the payload."""
+    with patch(
+        "custom_components.ampeco_ev_charger.coordinator.EVChargerDataUpdateCoordinator._async_update_data",
+        return_value=getattr(request, "param", EMPTY_DATA),
+    ) as mock_update:
+        yield mock_update
+
 
-async def test_setup_entry(hass, mock_config_entry_data, mock_charger_status_response):
+@pytest.mark.parametrize(
+    "patch_coordinator",
+    [EMPTY_DATA, CHARGING_DATA],
+    ids=["idle", "charging"],
+    indirect=True,
+)
+async def test_setup_entry(hass, mock_config_entry_data, patch_coordinator):
     """Test setup entry."""
     config_entry = MockConfigEntry(
         domain=DOMAIN,
         data=mock_config_entry_data,
         entry_id="test",
     )
+    config_entry.add_to_hass(hass)
 
-    with patch(
-        "custom_components.ev_charger.coordinator.EVChargerDataUpdateCoordinator._async_update_data",
-        return_value={
-            "status": mock_charger_status_response["data"],
-            "session": {},
-        },
-    ):
-        assert await async_setup_entry(hass, config_entry)
-        await hass.async_block_till_done()
-        assert DOMAIN in hass.data
-        assert config_entry.entry_id in hass.data[DOMAIN]
-
-async def test_unload_entry(hass, mock_config_entry_data):
+    assert await async_setup_entry(hass, config_entry)
+    await hass.async_block_till_done()
+    assert DOMAIN in hass.data
+    assert config_entry.entry_id in hass.data[DOMAIN]
+
+    assert await async_unload_entry(hass, config_entry)
+
+async def test_unload_entry(hass, mock_config_entry_data, patch_coordinator):
     """Test unloading entry."""
     config_entry = MockConfigEntry(
         domain=DOMAIN,
         data=mock_config_entry_data,
         entry_id="test",
     )
+    config_entry.add_to_hass(hass)
 
-    with patch(
-        "custom_components.ev_charger.coordinator.EVChargerDataUpdateCoordinator._async_update_data",
-        return_value={"status": {}, "session": {}},
-    ):
-        assert await async_setup_entry(hass, config_entry)
-        await hass.async_block_till_done()
-        assert await async_unload_entry(hass, config_entry)
-        assert config_entry.entry_id not in hass.data[DOMAIN] 
\ No newline at end of file
+    assert await async_setup_entry(hass, config_entry)
+    await hass.async_block_till_done()
+    assert await async_unload_entry(hass, config_entry)
+    assert config_entry.entry_id not in hass.data[DOMAIN]
+
+
+async def test_resolve_device_not_indexed(
+    hass, mock_config_entry_data, patch_coordinator
+):
+    """Test service device resolution falls back to the device registry."""
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data=mock_config_entry_data,
+        entry_id="test",
+    )
+    config_entry.add_to_hass(hass)
+
+    assert await async_setup_entry(hass, config_entry)
+    await hass.async_block_till_done()
+
+    evse_id = mock_config_entry_data[CONF_EVSE_ID]
+    device = dr.async_get(hass).async_get_or_create(
+        config_entry_id=config_entry.entry_id,
+        identifiers={(DOMAIN, evse_id)},
+    )
+    # Force an index miss
+    hass.data[DOMAIN].pop(DEVICE_INDEX, None)
+
+    call = MagicMock(data={"device_id": device.id})
+    coordinator, resolved_evse_id = _resolve_device_coordinator(hass, call)
+
+    assert coordinator is hass.data[DOMAIN][config_entry.entry_id]
+    assert resolved_evse_id == evse_id
+    assert hass.data[DOMAIN][DEVICE_INDEX][device.id] == (coordinator, evse_id)
+
+    assert await async_unload_entry(hass, config_entry)
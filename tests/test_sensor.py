@@ -1,16 +1,8 @@
 """Test AMPECO EV Charger sensor platform."""
 from unittest.mock import patch
-import pytest
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
-from custom_components.ev_charger.const import DOMAIN
-from custom_components.ev_charger.sensor import (
-    ChargerStatusSensor,
-    ChargingSessionSensor,
-    ChargingCurrentSensor,
-    ChargingEnergySensor,
-    ChargingDurationSensor,
-)
+from custom_components.ampeco_ev_charger.const import DOMAIN
 
 async def test_sensors(hass, mock_config_entry_data, mock_charger_status_response, mock_active_session_response):
     """Test sensor creation and values."""
@@ -21,7 +13,7 @@ async def test_sensors(hass, mock_config_entry_data, mock_charger_status_respons
     )
 
     with patch(
-        "custom_components.ev_charger.coordinator.EVChargerDataUpdateCoordinator._async_update_data",
+        "custom_components.ampeco_ev_charger.coordinator.EVChargerDataUpdateCoordinator._async_update_data",
         return_value={
             "status": mock_charger_status_response["data"],
             "session": mock_active_session_response["session"],